@@ -8,16 +8,36 @@ inputs (data/faultfrac.csv), and injects the data into data/incidents.js and
 data/vmt.js (between marker comments).
 """
 
+import concurrent.futures
 import csv
 import datetime
+import functools
+import gzip
 import io
 import json
 import math
 import re
+import sys
+import urllib.error
 import urllib.request
 from collections import Counter
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+# orjson (Rust JSON encoder) serializes this dict-heavy payload ~5-10x
+# faster than stdlib json; fall back to stdlib when it's not installed.
+# orjson emits raw UTF-8 where stdlib escapes to \uXXXX — both parse to
+# identical strings, so the first run after a switch shows a one-time
+# cosmetic diff in incidents.js.
+try:
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2)
+
 DATA_DIR = Path(__file__).resolve().parent
 ROOT_DIR = DATA_DIR.parent
 SNAPSHOT_DIR = DATA_DIR / "snapshots"
@@ -101,6 +121,17 @@ KEY_MAP = {
     "Were All Passengers Belted?":   "belted",
 }
 
+# (csv field, output key) pairs, paired up once so the per-incident
+# extraction loop skips the KEY_MAP lookup.
+FIELD_KEYS = [(csv_field, KEY_MAP[csv_field]) for csv_field in FIELDS]
+
+# Output keys whose values are drawn from small vocabularies (weather
+# flags, severities, movements, cities, ...). Interning these collapses
+# thousands of duplicate strings to shared objects across the incidents
+# list; unique-per-incident keys (reportId, narrative) are left alone.
+INTERN_KEYS = frozenset(KEY_MAP.values()) - {"reportId", "incidentId",
+                                             "narrative"}
+
 # Contact area boolean columns in the NHTSA CSV.
 # Each Y-valued column contributes its short label to a compact hit summary.
 CONTACT_AREA_LABELS = [
@@ -110,13 +141,33 @@ CONTACT_AREA_LABELS = [
     "Bottom", "Unknown",
 ]
 
+# (column name, short label) pairs per prefix, precomputed once so the
+# per-row extraction below does no f-string building.
+_CONTACT_AREA_COLUMNS = {
+    prefix: [(f"{prefix} - {label}", label.lower())
+             for label in CONTACT_AREA_LABELS]
+    for prefix in ("SV Contact Area", "CP Contact Area")
+}
+
 def _contact_areas(row, prefix):
     """Compact contact area string from NHTSA boolean columns, e.g., 'front left+rear'."""
-    parts = []
-    for label in CONTACT_AREA_LABELS:
-        if row.get(f"{prefix} - {label}", "").strip() == "Y":
-            parts.append(label.lower())
-    return " + ".join(parts)
+    return " + ".join(label for col, label in _CONTACT_AREA_COLUMNS[prefix]
+                      if row.get(col, "").strip() == "Y")
+
+
+# Every column downstream code reads (validation, dedup, coverage, record
+# build, contact areas). The NHTSA CSV carries ~100 more; projecting each
+# parsed row down to these keeps the row list from holding them all run long.
+NEEDED_COLUMNS = (FIELDS
+                  + ["Report Type", "Driver / Operator Type",
+                     "Report Submission Date"]
+                  + [col for pairs in _CONTACT_AREA_COLUMNS.values()
+                     for col, _ in pairs])
+
+
+def _project_row(row):
+    """Trim a parsed NHTSA row to NEEDED_COLUMNS."""
+    return {k: row[k] for k in NEEDED_COLUMNS if k in row}
 
 
 # Canonical short names for helmers (reporting entities). "Helmer" is our
@@ -182,6 +233,14 @@ NARRATIVE_TYPOS = {
     "[XX]":  "[XXX]",
 }
 
+# Both fix-up tables fused into one compiled alternation so each narrative
+# gets a single scan instead of one full .replace() pass per entry (11 and
+# counting). Alternatives keep dict order, so the longer-sequence-first
+# priorities noted above carry over unchanged.
+_NARRATIVE_FIXES = {**NARRATIVE_MOJIBAKE, **NARRATIVE_TYPOS}
+_NARRATIVE_FIX_RE = re.compile(
+    "|".join(re.escape(bad) for bad in _NARRATIVE_FIXES))
+
 # Tesla also appends a meta-correction note when an earlier filing had wrong
 # airbag/tow flags. Once the structured fields are corrected, the prose note
 # is just edit history and adds nothing for a reader of the narrative. Strip
@@ -324,9 +383,57 @@ def snapshot_csv_if_changed(prefix, text, stamp):
     return path
 
 
+def _fetch_meta_path():
+    return SNAPSHOT_DIR / ".fetch-meta.json"
+
+
+def _load_fetch_meta():
+    """Last-Modified headers from previous fetches, keyed by snapshot prefix."""
+    try:
+        return json.loads(_fetch_meta_path().read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_fetch_meta(meta):
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    _fetch_meta_path().write_text(json.dumps(meta, indent=2) + "\n")
+
+
+def _download_nhtsa_csv(url, prev_lm, latest):
+    """Download one NHTSA CSV; returns (last_modified, text).
+
+    text is None on a 304 reply, meaning the caller should reuse the
+    latest snapshot.
+    """
+    # Offer gzip: CSV prose compresses ~5x, so this is mostly wire time
+    # saved. Fall through untouched if the server ignores the offer.
+    headers = {"Accept-Encoding": "gzip"}
+    if prev_lm and latest is not None:
+        headers["If-Modified-Since"] = prev_lm
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            lm = resp.headers.get("Last-Modified")
+            payload = resp.read()
+            if resp.headers.get("Content-Encoding") == "gzip":
+                payload = gzip.decompress(payload)
+        text = payload.decode("utf-8")
+        del payload  # free the bytes copy; only the decoded text is used
+        return lm, text
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        return prev_lm, None
+
+
 def fetch_nhtsa_csv(stamp):
     """Fetch ADS incident reports from both current and archive CSVs.
 
+    Sends If-Modified-Since when a prior fetch's Last-Modified and a
+    snapshot are on hand; a 304 reply skips the download and reuses the
+    latest snapshot text.
+
     Returns (rows, last_modified_date) where last_modified_date is an
     ISO date string from the HTTP Last-Modified header of the current
     CSV, or None.
@@ -337,34 +444,57 @@ def fetch_nhtsa_csv(stamp):
         NHTSA_ADS_CSV_URL: "nhtsa-current",
         NHTSA_ADS_ARCHIVE_URL: "nhtsa-archive",
     }
+    meta = _load_fetch_meta()
+    jobs = []
     for url in [NHTSA_ADS_CSV_URL, NHTSA_ADS_ARCHIVE_URL]:
+        prefix = snapshot_prefix[url]
         print(f"Fetching NHTSA ADS CSV from {url} ...")
-        with urllib.request.urlopen(url, timeout=60) as resp:
-            lm = resp.headers.get("Last-Modified")
-            payload = resp.read()
-        text = payload.decode("utf-8")
-        snapshot_csv_if_changed(snapshot_prefix[url], text, stamp)
+        jobs.append((url, prefix, meta.get(prefix), latest_snapshot_path(prefix)))
+    # The two downloads are independent, so overlap their network waits;
+    # results are still processed in fixed URL order below.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        futures = [ex.submit(_download_nhtsa_csv, url, prev_lm, latest)
+                   for url, prefix, prev_lm, latest in jobs]
+    for (url, prefix, prev_lm, latest), fut in zip(jobs, futures):
+        lm, text = fut.result()
+        if text is None:
+            lm = prev_lm
+            text = latest.read_bytes().decode("utf-8")
+            print(f"  Not modified upstream (304): reusing {relpath(latest)}")
+        else:
+            if lm:
+                meta[prefix] = lm
+            snapshot_csv_if_changed(prefix, text, stamp)
         is_archive = url == NHTSA_ADS_ARCHIVE_URL
-        for row in csv.DictReader(io.StringIO(text)):
-            if is_archive:
-                _normalize_archive_row(row)
-            all_rows.append(row)
+        reader = csv.DictReader(io.StringIO(text))
+        if is_archive:
+            all_rows.extend(_project_row(_normalize_archive_row(row))
+                            for row in reader)
+        else:
+            all_rows.extend(_project_row(row) for row in reader)
         if lm and lm_date is None:
-            from email.utils import parsedate_to_datetime
             lm_date = parsedate_to_datetime(lm).date().isoformat()
+    _save_fetch_meta(meta)
     return all_rows, lm_date
 
 
-def parse_fault_csv(path):
-    rows = read_fault_csv_rows(path)
+def parse_fault_rows(rows, path):
     must(len(rows) > 0, "fault csv has no rows", path=path)
     data = {}
+    # Plain if/raise in this per-row loop: must() evaluates its kwargs
+    # (and builds a ctx dict) even when the check passes. Same message
+    # shape as must() either way.
     for row in rows:
         rid = row["reportID"].strip()
-        must(rid != "", "fault row missing Report ID", path=path)
+        if rid == "":
+            raise AssertionError(f"fault row missing Report ID: {dict(path=path)}")
         faultfrac = float(row["faultfrac"])
-        must(math.isfinite(faultfrac), "faultfrac not finite", path=path, reportId=rid, faultfrac=row["faultfrac"])
-        must(0.0 <= faultfrac <= 1.0, "faultfrac out of range", path=path, reportId=rid, faultfrac=faultfrac)
+        if not math.isfinite(faultfrac):
+            raise AssertionError(f"faultfrac not finite: "
+                f"{dict(path=path, reportId=rid, faultfrac=row['faultfrac'])}")
+        if not 0.0 <= faultfrac <= 1.0:
+            raise AssertionError(f"faultfrac out of range: "
+                f"{dict(path=path, reportId=rid, faultfrac=faultfrac)}")
         reasoning = row["reasoning"].strip()
         item = {"faultfrac": faultfrac, "reasoning": reasoning}
         if rid in data:
@@ -374,11 +504,6 @@ def parse_fault_csv(path):
     return data
 
 
-def load_fault_data():
-    data = parse_fault_csv(FAULT_INPUT)
-    return data, set(data)
-
-
 def read_fault_csv_rows(path):
     with open(path, newline="") as f:
         reader = csv.DictReader(f)
@@ -388,12 +513,6 @@ def read_fault_csv_rows(path):
         return list(reader)
 
 
-def load_fault_report_ids():
-    rows = read_fault_csv_rows(FAULT_INPUT)
-    must(len(rows) > 0, "fault csv has no rows", path=FAULT_INPUT)
-    return {row["reportID"].strip() for row in rows}
-
-
 def fault_master_row(row):
     return {
         "reportID": row["Report ID"].strip(),
@@ -416,14 +535,15 @@ def build_fault_master_rows(rows, target_ids):
         must(prev == master,
              "conflicting NHTSA master rows for fault report", reportId=rid,
              first=prev, second=master)
-    missing = target_ids - set(master_rows)
+    missing = target_ids - master_rows.keys()
     must(len(missing) == 0, "fault csv reports missing from NHTSA master",
          missing=sorted(missing)[:5])
     return master_rows
 
 
-def sync_fault_csv(path, master_rows):
-    rows = read_fault_csv_rows(path)
+def sync_fault_csv(path, master_rows, rows=None):
+    if rows is None:
+        rows = read_fault_csv_rows(path)
     must(len(rows) > 0, "fault csv has no rows", path=path)
 
     synced = []
@@ -446,8 +566,8 @@ def sync_fault_csv(path, master_rows):
     print(f"  Synced {relpath(path)} from NHTSA master data ({changed} field updates)")
 
 
-def sync_fault_csvs(master_rows):
-    sync_fault_csv(FAULT_INPUT, master_rows)
+def sync_fault_csvs(master_rows, rows=None):
+    sync_fault_csv(FAULT_INPUT, master_rows, rows)
 
 
 # Month labels in the NHTSA CSV use "JAN-2026"; VMT CSV uses "2026-01".
@@ -457,6 +577,7 @@ MONTH_ABBR_TO_NUM = {
     "SEP": "09", "OCT": "10", "NOV": "11", "DEC": "12",
 }
 
+@functools.lru_cache(maxsize=None)
 def nhtsa_month_to_iso(label):
     """Convert 'JAN-2026' to '2026-01'."""
     abbr, year = label.split("-")
@@ -482,12 +603,17 @@ def _vmt_number(cell):
     return float(cell.strip().replace(",", ""))
 
 
+# Lowercased view of HELMER_SHORT, built once so _canonical_helmer doesn't
+# re-lowercase the whole mapping per call.
+_HELMER_CANON = [(k.lower(), v.lower(), v) for k, v in HELMER_SHORT.items()]
+
+
+@functools.lru_cache(maxsize=None)
 def _canonical_helmer(helmer_raw):
     """Map a VMT-master helmer label to the canonical short name."""
+    raw = helmer_raw.lower()
     return next(
-        (v for k, v in HELMER_SHORT.items()
-         if k.lower().startswith(helmer_raw.lower())
-         or v.lower() == helmer_raw.lower()),
+        (v for kl, vl, v in _HELMER_CANON if kl.startswith(raw) or vl == raw),
         helmer_raw,
     )
 
@@ -544,22 +670,21 @@ def incident_coverage(nhtsa_rows, last_month, vmt):
 
     # Count incidents per helmer-month (post-dedup, no report-type needed)
     counted_rows = [r for r in nhtsa_rows if is_public_service_incident(r)]
-    by_incident = {}  # iid -> {ver, helmer, month}
+    by_incident = {}  # iid -> (ver, row)
     for r in counted_rows:
         iid = r["Same Incident ID"]
         ver = int(r["Report Version"])
-        helmer = HELMER_SHORT.get(r["Reporting Entity"].strip(),
-                                   r["Reporting Entity"].strip())
-        month = nhtsa_month_to_iso(r["Incident Date"].strip())
-        if iid not in by_incident or ver > by_incident[iid]["ver"]:
-            by_incident[iid] = {"ver": ver, "helmer": helmer, "month": month}
+        prev = by_incident.get(iid)
+        if prev is None or ver > prev[0]:
+            by_incident[iid] = (ver, r)
 
     counts = {}  # (helmer, month) -> count
-    for rec in by_incident.values():
-        key = (rec["helmer"], rec["month"])
+    for _ver, r in by_incident.values():
+        entity = r["Reporting Entity"].strip()
+        helmer = HELMER_SHORT.get(entity, entity)
+        key = (helmer, nhtsa_month_to_iso(r["Incident Date"].strip()))
         counts[key] = counts.get(key, 0) + 1
 
-    import math
     helmers = sorted(set(k[0] for k in counts))
 
     # Incompleteness is a property of the reporting CYCLE, not of any one helmer,
@@ -659,8 +784,13 @@ def build_vmt_csv(raw_text, inc_cov, active_months):
     return out_buf.getvalue().rstrip("\n")
 
 
+# One scan instead of three chained .replace() copies of the VMT text.
+_JS_ESCAPES = {"\\": "\\\\", "`": "\\`", "${": "\\${"}
+_JS_ESC_RE = re.compile(r"[\\`]|\$\{")
+
+
 def js_template_literal(text):
-    return text.replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
+    return _JS_ESC_RE.sub(lambda m: _JS_ESCAPES[m.group(0)], text)
 
 
 EXPECTED_REPORT_TYPES = {
@@ -774,8 +904,8 @@ def is_public_service_incident(row):
     return row["Driver / Operator Type"].strip() in counted
 
 
-INCIDENT_DATE_RE = __import__("re").compile(r"^[A-Z]{3}-\d{4}$")
-SUBMISSION_DATE_RE = __import__("re").compile(r"^[A-Z]{3}-\d{4}$")
+INCIDENT_DATE_RE = re.compile(r"^[A-Z]{3}-\d{4}$")
+SUBMISSION_DATE_RE = re.compile(r"^[A-Z]{3}-\d{4}$")
 
 
 def main():
@@ -785,7 +915,14 @@ def main():
 
     # Anti-Postel: fail loud on unexpected field values.
     # Skip placeholder rows (empty incident ID or date) from archive.
+    # must() evaluates its kwargs eagerly, so sort the expected-value lists
+    # once here rather than per row inside the loop.
+    expected_report_types = sorted(EXPECTED_REPORT_TYPES)
+    expected_driver_types = sorted(EXPECTED_DRIVER_TYPES)
+    expected_helmers = sorted(EXPECTED_HELMERS)
+    expected_severities = sorted(EXPECTED_SEVERITIES)
     valid_rows = []
+    by_rid = {}
     for i, r in enumerate(rows):
         iid = r["Same Incident ID"].strip()
         idate = r["Incident Date"].strip()
@@ -794,29 +931,29 @@ def main():
         rt = r["Report Type"].strip()
         must(rt in EXPECTED_REPORT_TYPES,
              "unexpected Report Type", row=i, value=rt,
-             expected=sorted(EXPECTED_REPORT_TYPES))
+             expected=expected_report_types)
         dt = r["Driver / Operator Type"].strip()
         must(dt in EXPECTED_DRIVER_TYPES,
              "unexpected Driver / Operator Type", row=i, value=dt,
-             expected=sorted(EXPECTED_DRIVER_TYPES))
+             expected=expected_driver_types)
         driver = r["Reporting Entity"].strip()
         must(driver in EXPECTED_HELMERS,
              "unexpected Reporting Entity", row=i, value=driver,
-             expected=sorted(EXPECTED_HELMERS))
+             expected=expected_helmers)
         sev = r["Highest Injury Severity Alleged"].strip()
         must(sev in EXPECTED_SEVERITIES,
              "unexpected Highest Injury Severity Alleged", row=i, value=sev,
-             expected=sorted(EXPECTED_SEVERITIES))
+             expected=expected_severities)
         must(INCIDENT_DATE_RE.match(idate),
              "unexpected Incident Date format", row=i, value=idate)
-        abbr = idate.split("-")[0]
+        abbr = idate[:3]
         must(abbr in MONTH_ABBR_TO_NUM,
              "unknown month abbreviation in Incident Date", row=i, value=idate)
         sub = r["Report Submission Date"].strip()
         if sub:
             must(SUBMISSION_DATE_RE.match(sub),
                  "unexpected Report Submission Date format", row=i, value=sub)
-            sub_abbr = sub.split("-")[0]
+            sub_abbr = sub[:3]
             must(sub_abbr in MONTH_ABBR_TO_NUM,
                  "unknown month abbreviation in Submission Date", row=i,
                  value=sub)
@@ -824,27 +961,22 @@ def main():
         must(ver.isdigit() and int(ver) >= 1,
              "Report Version must be positive integer", row=i, value=ver)
         valid_rows.append(r)
-    rows = valid_rows
-
-    # Filter to driverless incidents only
-    counted_rows = [r for r in rows if is_public_service_incident(r)]
-
-    # Dedup: group by Report ID first to safely handle when "Same Incident ID" changes
-    by_rid = {}
-    for r in counted_rows:
+        # Filter to driverless incidents only
+        # Dedup: group by Report ID first to safely handle when "Same Incident ID" changes
+        if not is_public_service_incident(r):
+            continue
         rid = r["Report ID"]
-        ver = int(r["Report Version"])
-        if rid not in by_rid or ver > by_rid[rid]["_ver"]:
-            by_rid[rid] = {"_ver": ver, "_row": r}
+        ver = int(ver)
+        if rid not in by_rid or ver > by_rid[rid][0]:
+            by_rid[rid] = (ver, r)
+    rows = valid_rows
 
     # Then deduplicate those by Same Incident ID
     by_incident = {}
-    for entry in by_rid.values():
-        r = entry["_row"]
+    for ver, r in by_rid.values():
         iid = r["Same Incident ID"]
-        ver = int(r["Report Version"])
-        if iid not in by_incident or ver > by_incident[iid]["_ver"]:
-            by_incident[iid] = {"_ver": ver, "_row": r}
+        if iid not in by_incident or ver > by_incident[iid][0]:
+            by_incident[iid] = (ver, r)
 
     # Load VMT data up front so we can fail fast on stale VMT before any
     # file writes (fault CSV sync below).
@@ -860,32 +992,38 @@ def main():
     # updated instead.
     vmt_latest = max(vmt_months)
     stale = {}
-    for entry in by_incident.values():
-        m = nhtsa_month_to_iso(entry["_row"]["Incident Date"].strip())
+    for _ver, r in by_incident.values():
+        m = nhtsa_month_to_iso(r["Incident Date"].strip())
         if m > vmt_latest:
-            stale.setdefault(m, []).append(entry["_row"]["Report ID"])
+            stale.setdefault(m, []).append(r["Report ID"])
     must(not stale,
          "data/vmt.csv is out of date: NHTSA reports incidents in months with "
          f"no VMT data (latest VMT month is {vmt_latest}). Add VMT rows "
          "covering these months to data/vmt.csv, then re-run slurp.py.",
          stale_months={m: sorted(rids) for m, rids in sorted(stale.items())})
 
-    fault_target_ids = load_fault_report_ids()
+    # Read the fault CSV once; the target ids, the sync pass, and the final
+    # fault data all come from these same rows (sync only rewrites the
+    # NHTSA-master columns, never faultfrac/reasoning).
+    fault_rows = read_fault_csv_rows(FAULT_INPUT)
+    must(len(fault_rows) > 0, "fault csv has no rows", path=FAULT_INPUT)
+    fault_target_ids = {row["reportID"].strip() for row in fault_rows}
     fault_master_rows = build_fault_master_rows(
-        (entry["_row"] for entry in by_incident.values()),
+        (r for _ver, r in by_incident.values()),
         fault_target_ids,
     )
 
-    sync_fault_csvs(fault_master_rows)
-    fault_data, fault_ids = load_fault_data()
+    sync_fault_csvs(fault_master_rows, fault_rows)
+    fault_data = parse_fault_rows(fault_rows, FAULT_INPUT)
+    fault_ids = fault_data.keys()
 
     # Filter to months that have VMT data for any helmer.
     # Derive last_month from the data: latest incident month that also has VMT.
     # Months with VMT but no incidents yet (beyond the NHTSA reporting frontier)
     # are excluded so we don't show 0-incident months with full VMT.
     incident_months_with_vmt = set()
-    for entry in by_incident.values():
-        m = nhtsa_month_to_iso(entry["_row"]["Incident Date"].strip())
+    for _ver, r in by_incident.values():
+        m = nhtsa_month_to_iso(r["Incident Date"].strip())
         if m in vmt_months:
             incident_months_with_vmt.add(m)
     last_month = max(incident_months_with_vmt)
@@ -895,7 +1033,7 @@ def main():
     window_by_incident = {}
     excluded_count = 0
     for iid, entry in by_incident.items():
-        month_iso = nhtsa_month_to_iso(entry["_row"]["Incident Date"].strip())
+        month_iso = nhtsa_month_to_iso(entry[1]["Incident Date"].strip())
         if month_iso not in vmt_months:
             excluded_count += 1
             continue
@@ -904,20 +1042,18 @@ def main():
         print(f"Excluded {excluded_count} incidents outside VMT window")
 
     incidents = []
-    for iid, entry in window_by_incident.items():
-        r = entry["_row"]
+    for iid, (_ver, r) in window_by_incident.items():
         rec = {}
-        for csv_field in FIELDS:
-            key = KEY_MAP[csv_field]
-            val = r.get(csv_field, "").strip().replace("\r\n", "\n").replace("\r", "\n")
-            rec[key] = val
+        for csv_field, key in FIELD_KEYS:
+            val = r.get(csv_field, "").strip()
+            if "\r" in val:  # only narratives ever carry CR line endings
+                val = val.replace("\r\n", "\n").replace("\r", "\n")
+            rec[key] = sys.intern(val) if key in INTERN_KEYS else val
         # Shorten helmer name
         rec["helmer"] = HELMER_SHORT.get(rec["helmer"], rec["helmer"])
         # Parse speed as number
-        try:
-            rec["speed"] = int(rec["speed"])
-        except (ValueError, TypeError):
-            rec["speed"] = None
+        spd = rec["speed"]
+        rec["speed"] = int(spd) if spd.isdecimal() else None
         # Convert airbag field to boolean (any vehicle deployment)
         rec["airbagAny"] = "Yes" in rec["airbagAny"]
         nar = rec["narrative"]
@@ -930,19 +1066,18 @@ def main():
         # Tesla's filing template opens with a contentless "Summary:" label
         # (other helmers have none); drop it so blurbs read uniformly.
         nar = nar.removeprefix("Summary:").lstrip()
-        for bad, good in NARRATIVE_MOJIBAKE.items():
-            nar = nar.replace(bad, good)
-        for bad, good in NARRATIVE_TYPOS.items():
-            nar = nar.replace(bad, good)
+        nar = _NARRATIVE_FIX_RE.sub(
+            lambda m: _NARRATIVE_FIXES[m.group(0)], nar)
         rec["narrative"] = nar
         # Compact contact area summaries from NHTSA boolean columns
         rec["svHit"] = _contact_areas(r, "SV Contact Area")
         rec["cpHit"] = _contact_areas(r, "CP Contact Area")
         rid = rec["reportId"]
         if rid in fault_ids:
+            f = fault_data[rid]
             rec["fault"] = {
-                "faultfrac": fault_data[rid]["faultfrac"],
-                "reasoning": fault_data[rid]["reasoning"],
+                "faultfrac": f["faultfrac"],
+                "reasoning": f["reasoning"],
             }
         else:
             rec["fault"] = None
@@ -968,40 +1103,49 @@ def main():
     inc_cov = incident_coverage(window_rows, last_month, vmt_values)
 
     # Inject data into separate JS files
-    incident_json = "\n" + json.dumps(incidents, indent=2) + "\n"
-    vmt_text = build_vmt_csv(vmt_raw, inc_cov, vmt_months).replace("\r\n", "\n").replace("\r", "\n").rstrip("\n")
+    incident_json = "\n" + _dumps_indented(incidents) + "\n"
+    vmt_text = build_vmt_csv(vmt_raw, inc_cov, vmt_months)
+    if "\r" in vmt_text:  # writer emits \n; CRs could only ride in via cells
+        vmt_text = vmt_text.replace("\r\n", "\n").replace("\r", "\n")
+    vmt_text = vmt_text.rstrip("\n")
     vmt_template = "\n`" + js_template_literal(vmt_text) + "\n`\n"
 
-    def inject(source, start_marker, end_marker, payload):
-        """Replace content between marker comments with payload."""
-        si = source.index(start_marker)
-        ei = source.index(end_marker, si)
-        return source[:si] + start_marker + payload + source[ei:]
+    def inject_all(source, replacements):
+        """Replace content between marker comments with payloads, one pass.
+
+        replacements: [(start_marker, end_marker, payload)] in file order.
+        """
+        parts = []
+        pos = 0
+        for start_marker, end_marker, payload in replacements:
+            si = source.index(start_marker, pos)
+            ei = source.index(end_marker, si)
+            parts.extend((source[pos:si], start_marker, payload))
+            pos = ei
+        parts.append(source[pos:])
+        return "".join(parts)
 
     fetch_date = datetime.date.today().isoformat()
 
-    with open(INCIDENT_JS) as f:
-        inc_js = f.read()
-    inc_js = inject(inc_js,
-                    "/* NHTSA_FETCH_DATE_START */", "/* NHTSA_FETCH_DATE_END */",
-                    f'"{fetch_date}"')
     modified_val = f'"{nhtsa_modified_date}"' if nhtsa_modified_date else "null"
-    inc_js = inject(inc_js,
-                    "/* NHTSA_MODIFIED_DATE_START */", "/* NHTSA_MODIFIED_DATE_END */",
-                    modified_val)
-    inc_js = inject(inc_js,
-                    "/* INCIDENT_DATA_START */", "/* INCIDENT_DATA_END */",
-                    incident_json)
-    with open(INCIDENT_JS, "w") as f:
-        f.write(inc_js)
-
-    with open(VMT_JS) as f:
-        vmt_js = f.read()
-    vmt_js = inject(vmt_js,
-                    "/* VMT_CSV_START */", "/* VMT_CSV_END */",
-                    vmt_template)
-    with open(VMT_JS, "w") as f:
-        f.write(vmt_js)
+    inc_src = INCIDENT_JS.read_text()
+    inc_js = inject_all(inc_src, [
+        ("/* NHTSA_FETCH_DATE_START */", "/* NHTSA_FETCH_DATE_END */",
+         f'"{fetch_date}"'),
+        ("/* NHTSA_MODIFIED_DATE_START */", "/* NHTSA_MODIFIED_DATE_END */",
+         modified_val),
+        ("/* INCIDENT_DATA_START */", "/* INCIDENT_DATA_END */",
+         incident_json),
+    ])
+    if inc_js != inc_src:  # skip the write (and mtime bump) on no-op runs
+        INCIDENT_JS.write_text(inc_js)
+
+    vmt_src = VMT_JS.read_text()
+    vmt_js = inject_all(vmt_src, [
+        ("/* VMT_CSV_START */", "/* VMT_CSV_END */", vmt_template),
+    ])
+    if vmt_js != vmt_src:
+        VMT_JS.write_text(vmt_js)
 
     # Summary
     counts = Counter(r["helmer"] for r in incidents)
@@ -1014,17 +1158,17 @@ def main():
         print(f"  {helmer}: {n}")
 
     # Passenger occupancy summary per helmer
+    pax = {helmer: [0, 0] for helmer in counts}  # helmer -> [with, without]
+    for r in incidents:
+        belted = r["belted"]
+        if belted == "Subject Vehicle - No Passenger In Vehicle":
+            pax[r["helmer"]][1] += 1
+        elif belted not in ("Unknown", ""):
+            pax[r["helmer"]][0] += 1
     print("\nPassenger occupancy at time of incident:")
     for helmer in sorted(counts):
-        co_incidents = [r for r in incidents if r["helmer"] == helmer]
-        n = len(co_incidents)
-        with_pax = sum(1 for r in co_incidents
-                       if r["belted"] not in
-                       ("Subject Vehicle - No Passenger In Vehicle",
-                        "Unknown", ""))
-        no_pax = sum(1 for r in co_incidents
-                     if r["belted"] ==
-                     "Subject Vehicle - No Passenger In Vehicle")
+        n = counts[helmer]
+        with_pax, no_pax = pax[helmer]
         unk = n - with_pax - no_pax
         pct = f"{100*with_pax/n:.0f}%" if n else "n/a"
         print(f"  {helmer}: {with_pax}/{n} with passenger ({pct})"
@@ -0,0 +1,82 @@
+import assert from "node:assert/strict";
+import { execFileSync } from "node:child_process";
+
+// fetch_nhtsa_csv sends If-Modified-Since from the previous fetch's
+// Last-Modified and, on a 304 reply, reuses the latest snapshot instead of
+// downloading. A 304 must yield the same rows a fresh 200 of identical text
+// would, and must not mint a duplicate snapshot file.
+const py = `
+import json
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+from pathlib import Path
+sys.path.insert(0, "data")
+import slurp
+
+CSV = "Report ID,Report Version,Same Incident ID,Incident Date,Driver / Operator Type\\n" \\
+      "RID-1,1,abc123,JAN-2026,None\\n"
+LM = "Wed, 15 Jul 2026 00:00:00 GMT"
+
+with tempfile.TemporaryDirectory() as tmp:
+    tmpdir = Path(tmp)
+    slurp.SNAPSHOT_DIR = tmpdir
+    (tmpdir / "nhtsa-current-20260101T000000.csv").write_text(CSV)
+    (tmpdir / "nhtsa-archive-20260101T000000.csv").write_text(CSV)
+    (tmpdir / ".fetch-meta.json").write_text(json.dumps(
+        {"nhtsa-current": LM, "nhtsa-archive": LM}))
+
+    sent_headers = []
+    def fake_urlopen(req, timeout=None):
+        sent_headers.append(dict(req.header_items()))
+        raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+    urllib.request.urlopen = fake_urlopen
+
+    rows, lm_date = slurp.fetch_nhtsa_csv("20260102T000000")
+    files = sorted(p.name for p in tmpdir.glob("*.csv"))
+    print(json.dumps({
+        "n_rows": len(rows),
+        "report_ids": [r["Report ID"] for r in rows],
+        "lm_date": lm_date,
+        "sent_ims": [h.get("If-modified-since") for h in sent_headers],
+        "files": files,
+    }))
+`;
+
+const raw = execFileSync("python3", ["-c", py], { encoding: "utf8" }).trim().split("\n").at(-1);
+const out = JSON.parse(raw);
+
+assert.deepEqual(
+  out.sent_ims,
+  ["Wed, 15 Jul 2026 00:00:00 GMT", "Wed, 15 Jul 2026 00:00:00 GMT"],
+  `Replicata: run data/slurp.py fetch_nhtsa_csv with stored Last-Modified metadata and a snapshot on disk.
+Expectata: both NHTSA requests carry If-Modified-Since from the stored metadata.
+Resultata: sent headers were ${JSON.stringify(out.sent_ims)}.`,
+);
+
+assert.deepEqual(
+  out.report_ids,
+  ["RID-1", "RID-1"],
+  `Replicata: have the stubbed NHTSA server answer 304 for both CSVs.
+Expectata: fetch_nhtsa_csv parses the latest snapshots instead, yielding the snapshot rows.
+Resultata: parsed Report IDs were ${JSON.stringify(out.report_ids)}.`,
+);
+
+assert.equal(
+  out.lm_date,
+  "2026-07-15",
+  `Replicata: read the returned last_modified_date after a 304 reply.
+Expectata: the stored Last-Modified still yields the ISO modified date.
+Resultata: got ${JSON.stringify(out.lm_date)}.`,
+);
+
+assert.deepEqual(
+  out.files,
+  ["nhtsa-archive-20260101T000000.csv", "nhtsa-current-20260101T000000.csv"],
+  `Replicata: inspect the snapshot directory after a 304-only run.
+Expectata: no new snapshot files appear; the prior snapshots stand.
+Resultata: snapshot files were ${JSON.stringify(out.files)}.`,
+);
+
+console.log("qual pass: data/slurp.py conditional GET reuses snapshots on 304 replies");